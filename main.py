@@ -1,21 +1,24 @@
+import io
 import zipfile
 import logging
 import sys
 import argparse
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import Popen
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import httpx
+import orjson
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.logging import RichHandler
 from rich.prompt import Confirm, Prompt
 
-BUILD_NAMES = []
-
 BUILD_TYPES = {
     "1": {"type": "release", "description": "(recommended) The default Remix version that prioritizes speed"},
     "2": {"type": "debugoptimized", "description": "For debugging issues. This build is still fast."},
@@ -57,33 +60,55 @@ args.build_type = get_build_type()
 
 print(f"Downloading {args.build_type} builds")
 
+# Repositories are extracted in this order, later ones overwrite files of earlier ones.
 REPOSITORIES = {
     "NVIDIAGameWorks/rtx-remix": {
         "repo_type": "release",
         "move_to": None,
-        "temp_dir": None,
-        "main_directory": True,
+        "version": None,  # Release tag or artifact id, filled in when fetched
     },
     "NVIDIAGameWorks/dxvk-remix": {
         "repo_type": "artifact",
-        "move_to": ".trex",  # Move this to a special subdirectory
-        "temp_dir": None,
-        "main_directory": False,
+        "move_to": ".trex",  # Extract this to a special subdirectory
+        "version": None,  # Release tag or artifact id, filled in when fetched
+        "build_name": None,  # Artifact name, filled in when fetched
         "artifact_branch": "main",
     },
     "NVIDIAGameWorks/bridge-remix": {
         "repo_type": "artifact",
-        "move_to": None,  # Move this to the root of the temp directory
-        "temp_dir": None,
-        "main_directory": False,
+        "move_to": None,  # Extract this to the root of the staging directory
+        "version": None,  # Release tag or artifact id, filled in when fetched
+        "build_name": None,  # Artifact name, filled in when fetched
         "artifact_branch": "main",
     },
 }
 
+# Read the downloads in 128 KiB chunks, and decompress archive members 1 MiB at a time.
+CHUNK_SIZE = 128 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Characters that can't appear in Windows file names, mapped like ZipFile.extract does.
+WINDOWS_ILLEGAL_CHARS = str.maketrans(':<>|"?*', "_______")
+
+# Leftovers from the build pipelines that aren't needed to run Remix.
+# Normcased, so matching ignores case on Windows like the filesystem does.
+CLEANUP_FILES = {os.path.normcase(name) for name in ("CRC.txt", "artifacts_readme.txt")}
+CLEANUP_SUFFIX = os.path.normcase(".pdb")
+
+# Records which version of every repository the remix directory holds.
+MANIFEST_NAME = ".rtxremix-manifest.json"
+
+# GitHub API responses are cached along with their ETag, so unchanged endpoints
+# can be revalidated with a 304 that doesn't count against the rate limit.
+CACHE_PATH = Path.home().joinpath(".cache", "rtxremix")
+
 HTTP = httpx.Client(
+    http2=True,
     headers={
         "User-Agent": f"Python/httpx v{httpx.__version__} - RTXRemix Downloader Script"
-    }
+    },
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+    timeout=httpx.Timeout(connect=10, read=30, write=30, pool=None),
 )
 LOGGER = logging.getLogger("rtxremix")
 FORMAT = "%(message)s"
@@ -97,113 +122,336 @@ PROGRESS = Progress(
     TextColumn("[bold blue] {task.completed} of {task.total} steps completed"),
     console=CONSOLE,
 )
-STEP_COUNTER = PROGRESS.add_task("Steps", total=len(REPOSITORIES) * 2 + 4)
+STEP_TOTAL = len(REPOSITORIES) * 2 + 2
+STEP_COUNTER = PROGRESS.add_task("Steps", total=STEP_TOTAL)
+PROGRESS_LOCK = threading.Lock()
 
 
 class HiddenPrompt(Prompt):
     prompt_suffix = ""
 
 
-def replace_recursively(root_path: Path, move_to: Path) -> None:
-    """Recursively replaces a directory with its contents while preserving the directory structure"""
-    for child in root_path.iterdir():
-        if child.is_file():
-            LOGGER.debug(f"Replacing {child} with {move_to.joinpath(child.name)}")
-            shutil.move(str(child), str(move_to.joinpath(child.name)))
-        elif child.is_dir():
-            LOGGER.debug(
-                f"Replacing {child} with {move_to.joinpath(child.name) if move_to else None}"
+def report(message: str, advance: int = 0) -> None:
+    """Prints a progress message, serialized so concurrent fetches don't interleave"""
+    with PROGRESS_LOCK:
+        PROGRESS.print(message)
+        if advance:
+            # The progress bar redraws itself on its own refresh tick.
+            PROGRESS.update(STEP_COUNTER, advance=advance, refresh=False)
+
+
+def read_manifest(path: Path) -> dict:
+    """Reads the versions installed in path, empty if there is no install yet"""
+    try:
+        return orjson.loads(path.joinpath(MANIFEST_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def get_json(repo: str, url: str) -> dict:
+    """Requests a GitHub API endpoint, revalidating the cached response if there is one"""
+    cache_file = CACHE_PATH.joinpath(f"{repo.replace('/', '_')}.json")
+    try:
+        cache = orjson.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+
+    cached = cache.get(url)
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+    resp = HTTP.get(url, headers=headers)
+    if resp.status_code == 304:
+        LOGGER.debug(f"{url} has not changed, using the cached response")
+        return cached["json"]
+
+    content = orjson.loads(resp.content)
+    if resp.is_success and "ETag" in resp.headers:
+        cache[url] = {"etag": resp.headers["ETag"], "json": content}
+        CACHE_PATH.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(orjson.dumps(cache))
+    return content
+
+
+def download(url: str) -> bytes:
+    """Downloads url into memory"""
+    buffer = io.BytesIO()
+    with HTTP.stream("GET", url, follow_redirects=True) as resp:
+        # Archives are served as-is, so read the raw body and skip httpx's decoders.
+        # Still decode if a server compresses the transfer anyway.
+        if resp.headers.get("Content-Encoding", "identity") == "identity":
+            chunks = resp.iter_raw(chunk_size=CHUNK_SIZE)
+        else:
+            chunks = resp.iter_bytes(chunk_size=CHUNK_SIZE)
+        for data in chunks:
+            buffer.write(data)
+    # getvalue() hands over the buffer's bytes object without copying it.
+    return buffer.getvalue()
+
+
+def member_path(root: str, name: str) -> str:
+    """Resolves where an archive member is extracted to, sanitized like ZipFile.extract"""
+    name = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    # Drop drive letters, UNC prefixes, redundant separators, "." and "..".
+    name = os.path.splitdrive(name)[1]
+    parts = [x for x in name.split(os.path.sep) if x not in ("", os.curdir, os.pardir)]
+    if os.path.sep == "\\":
+        # Replace characters Windows doesn't allow, and trailing dots.
+        parts = [x.translate(WINDOWS_ILLEGAL_CHARS).rstrip(".") for x in parts]
+        parts = [x for x in parts if x]
+
+    root = os.path.abspath(root)
+    target = os.path.normpath(os.path.join(root, *parts))
+    if os.path.commonpath([root, target]) != root:
+        raise zipfile.BadZipFile(f"Refusing to extract {name} outside {root}")
+    return target
+
+
+def extract(archive: bytes, path: Path, strip_root: bool = False) -> None:
+    """Extracts a zip archive into path, decompressing its members in parallel
+
+    With strip_root, the archive's single top directory is left out,
+    so its contents land directly in path.
+    """
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        infolist = zf.infolist()
+
+    if strip_root:
+        top = infolist[0].filename.split("/", 1)[0] + "/" if infolist else ""
+        if not top or any(not info.filename.startswith(top) for info in infolist):
+            raise zipfile.BadZipFile(
+                "Expected everything in the archive to be inside a single top directory"
             )
-            move_to.joinpath(child.name).mkdir(exist_ok=True)
-            replace_recursively(child, move_to.joinpath(child.name))
-            child.rmdir()
+        infolist = [info for info in infolist if info.filename != top]
+        for info in infolist:
+            info.filename = info.filename[len(top) :]
+
+    root = os.fspath(path)
+    members = [
+        (info, member_path(root, info.filename))
+        for info in infolist
+        if not info.is_dir()
+    ]
+    # Create every directory up front, so the workers never race on makedirs.
+    directories = {os.path.dirname(target) for _, target in members}
+    directories.update(
+        member_path(root, info.filename) for info in infolist if info.is_dir()
+    )
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+
+    # ZipFile isn't thread-safe, so every worker opens its own handle.
+    # BytesIO shares the underlying bytes object, so this doesn't copy the archive.
+    local = threading.local()
+    handles = []
+
+    def extract_member(member: tuple[zipfile.ZipInfo, str]) -> None:
+        info, target = member
+        if not hasattr(local, "zf"):
+            local.zf = zipfile.ZipFile(io.BytesIO(archive))
+            handles.append(local.zf)
+        with local.zf.open(info) as source, open(target, "wb") as f:
+            # Reserve the whole file up front, so the filesystem can allocate it in
+            # one go instead of growing it with every write.
+            if info.file_size:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(f.fileno(), 0, info.file_size)
+                else:
+                    os.ftruncate(f.fileno(), info.file_size)
+            shutil.copyfileobj(source, f, COPY_BUFFER_SIZE)
 
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for _ in executor.map(extract_member, members):
+                pass
+    finally:
+        for zf in handles:
+            zf.close()
 
-def fetch_release(repo: str, temp_dir: TemporaryDirectory) -> TemporaryDirectory:
-    """Fetches the latest release from a repository"""
-    path = Path(temp_dir.name)
 
-    PROGRESS.print(
-        f"Fetching the latest release info from [bold blue]{repo}[/bold blue]"
+def replace_recursively(root_path: Path, move_to: Path) -> None:
+    """Recursively replaces a directory with its contents while preserving the directory structure
+
+    Anything that doesn't exist in move_to yet is moved over in a single rename,
+    only directories present on both sides are merged entry by entry.
+    """
+    root_path, move_to = os.fspath(root_path), os.fspath(move_to)
+    os.makedirs(move_to, exist_ok=True)
+    # Renames only work within a filesystem, shutil.move copies across them.
+    if os.stat(root_path).st_dev == os.stat(move_to).st_dev:
+        move = os.replace
+    else:
+        move = shutil.move
+
+    # Skip formatting a message per entry when nobody will see it.
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
+
+    stack = [(root_path, move_to)]
+    merged = []
+    while stack:
+        source, destination = stack.pop()
+        with os.scandir(source) as entries:
+            for entry in entries:
+                target = os.path.join(destination, entry.name)
+                if entry.is_dir(follow_symlinks=False) and os.path.isdir(target):
+                    if debug:
+                        LOGGER.debug(f"Merging {entry.path} into {target}")
+                    stack.append((entry.path, target))
+                    merged.append(entry.path)
+                else:
+                    if debug:
+                        LOGGER.debug(f"Replacing {target} with {entry.path}")
+                    move(entry.path, target)
+
+    # Merged directories are empty now, remove them deepest first.
+    for source in reversed(merged):
+        os.rmdir(source)
+
+
+def fetch_release(repo: str) -> str:
+    """Fetches the latest release info from a repository and returns its download url"""
+    report(f"Fetching the latest release info from [bold blue]{repo}[/bold blue]")
+    release = get_json(repo, f"https://api.github.com/repos/{repo}/releases/latest")
+
+    asset = next((a for a in release["assets"] if "symbols" not in a["name"]), None)
+    if asset is None:
+        raise RuntimeError(
+            f"The latest release of {repo} ({release['tag_name']}) has no downloadable asset"
+        )
+    REPOSITORIES[repo]["version"] = release["tag_name"]
+    return asset["browser_download_url"]
+
+
+def fetch_artifact(repo: str) -> str:
+    """Fetches the latest artifact info from a repository and returns its download url"""
+    report(f"Fetching the latest artifact info from [bold blue]{repo}[/bold blue]")
+    branch = REPOSITORIES[repo]["artifact_branch"]
+    artifacts = get_json(
+        repo, f"https://api.github.com/repos/{repo}/actions/artifacts?per_page=50"
     )
-    resp = HTTP.get(f"https://api.github.com/repos/{repo}/releases/latest")
-    json = resp.json()
-
-    for asset in json["assets"]:
-        if "symbols" not in asset["name"]:
-            download_url = asset["browser_download_url"]
-            size = asset["size"]
-
-    PROGRESS.print(f"Downloading latest release from [bold blue]{repo}[/bold blue]")
-    PROGRESS.advance(STEP_COUNTER)
-    with open(path.joinpath(f"{json['name']}.zip"), "wb") as f:
-        with HTTP.stream(
-            "GET", download_url, timeout=30, follow_redirects=True
-        ) as resp:
-            for data in resp.iter_bytes():
-                f.write(data)
-
-    PROGRESS.print(f"Extracting latest release from [bold blue]{repo}[/bold blue]")
-    PROGRESS.advance(STEP_COUNTER)
-    zipfile.ZipFile(path.joinpath(f"{json['name']}.zip")).extractall(path)
-    path.joinpath(f"{json['name']}.zip").unlink()
-
-    # Move the contents of the zip to the root of the temp directory.
-    child_path = next(path.iterdir())
-    replace_recursively(child_path, path)
-    child_path.rmdir()
-
-    return temp_dir
-
-
-def fetch_artifact(repo: str, temp_dir: TemporaryDirectory) -> TemporaryDirectory:
-    """Fetches the latest artifact from a repository"""
-    path = Path(temp_dir.name)
-
-    PROGRESS.print(
-        f"Fetching the latest artifact info from [bold blue]{repo}[/bold blue]"
+    # Artifacts don't carry their run's conclusion, so look up the succeeded runs.
+    runs = get_json(
+        repo,
+        f"https://api.github.com/repos/{repo}/actions/runs"
+        f"?branch={branch}&status=success&per_page=100",
     )
-    resp = HTTP.get(f"https://api.github.com/repos/{repo}/actions/runs")
-    json = resp.json()
-
-    # Grab the first succeeded run on the specified artifact branch.
-    # Runs are sorted from newest to oldest by GitHub. So no need to date check.
-    for run in json["workflow_runs"]:
-        if (
-            run["head_branch"] == REPOSITORIES[repo]["artifact_branch"]
-            and run["conclusion"] == "success"
-        ):
-            resp = HTTP.get(run["artifacts_url"])
-            json = resp.json()
-            break
-
-    for artifact in json["artifacts"]:
-        if args.build_type in artifact["name"]:
-            artifact_name = artifact["name"]
-            id = artifact["id"]
-            size = artifact["size_in_bytes"]
-            BUILD_NAMES.append(artifact_name)
-            break
-
-
-    PROGRESS.print(f"Downloading latest artifact from [bold blue]{repo}[/bold blue]")
-    PROGRESS.advance(STEP_COUNTER)
-    with open(path.joinpath(f"{artifact_name}.zip"), "wb") as f:
-        with HTTP.stream(
-            "GET",
-            f"https://nightly.link/{repo}/actions/artifacts/{id}.zip",
-            timeout=30,
-            follow_redirects=True,
-        ) as resp:
-            for data in resp.iter_bytes():
-                f.write(data)
-
-    PROGRESS.print(f"Extracting latest artifact from [bold blue]{repo}[/bold blue]")
-    PROGRESS.advance(STEP_COUNTER)
-    zipfile.ZipFile(path.joinpath(f"{artifact_name}.zip")).extractall(path)
-    path.joinpath(f"{artifact_name}.zip").unlink()
-
-    return temp_dir
+    succeeded = {run["id"] for run in runs["workflow_runs"]}
+
+    # Grab the first artifact of the build type from a succeeded run on the specified
+    # artifact branch of the repository itself, not a fork's branch of the same name.
+    # Artifacts are sorted from newest to oldest by GitHub. So no need to date check.
+    artifact = next(
+        (
+            a
+            for a in artifacts["artifacts"]
+            if a["workflow_run"]["id"] in succeeded
+            and a["workflow_run"]["head_branch"] == branch
+            and a["workflow_run"]["head_repository_id"]
+            == a["workflow_run"]["repository_id"]
+            and args.build_type in a["name"]
+            and not a["expired"]
+        ),
+        None,
+    )
+    if artifact is None:
+        raise RuntimeError(
+            f"No recent {args.build_type} artifact from a succeeded run found for "
+            f"{repo} on the {branch} branch"
+        )
+    REPOSITORIES[repo]["version"] = artifact["id"]
+    REPOSITORIES[repo]["build_name"] = artifact["name"]
+    return f"https://nightly.link/{repo}/actions/artifacts/{artifact['id']}.zip"
+
+
+def fetch_repository(repo: str, data: dict) -> str:
+    """Fetches a repository's info according to its repo_type"""
+    if data["repo_type"] == "release":
+        return fetch_release(repo)
+    return fetch_artifact(repo)
+
+
+def download_repository(repo: str, url: str) -> bytes:
+    """Downloads the archive of a repository"""
+    report(
+        f"Downloading latest {REPOSITORIES[repo]['repo_type']} from [bold blue]{repo}[/bold blue]",
+        advance=1,
+    )
+    return download(url)
+
+
+def install(download_urls: dict, final_path: Path) -> None:
+    """Downloads every repository and installs them into final_path"""
+    with TemporaryDirectory(prefix="RTXREMIX-") as staging:
+        staging_path = Path(staging)
+
+        # The repositories are independent, so download them all at once.
+        with ThreadPoolExecutor(max_workers=len(REPOSITORIES)) as executor:
+            futures = {
+                repo: executor.submit(download_repository, repo, url)
+                for repo, url in download_urls.items()
+            }
+
+            # Extract every archive straight to its final location in the staging
+            # directory, in order, while the remaining downloads carry on. This is
+            # where downloading and extracting overlap: a single zip can't be
+            # extracted while it streams in, since zipfile needs its central
+            # directory at the very end.
+            for repo, data in REPOSITORIES.items():
+                archive = futures.pop(repo).result()
+                report(
+                    f"Extracting latest {data['repo_type']} from [bold blue]{repo}[/bold blue]",
+                    advance=1,
+                )
+                extract(
+                    archive,
+                    staging_path.joinpath(data["move_to"] or ""),
+                    # Releases wrap everything in a top directory, leave it out.
+                    strip_root=data["repo_type"] == "release",
+                )
+
+        # Delete debugging symbols and build leftovers in a single walk
+        report("Cleaning up debugging symbols", advance=1)
+        for root, _, files in os.walk(staging_path):
+            for name in files:
+                normalized = os.path.normcase(name)
+                if normalized in CLEANUP_FILES or normalized.endswith(CLEANUP_SUFFIX):
+                    os.unlink(os.path.join(root, name))
+
+        # Move the staging directory to working dir
+        report('Moving files to the "remix" directory', advance=1)
+        try:
+            # On a first run the whole tree can be moved in with a single rename.
+            os.rename(staging_path, final_path)
+        except OSError:
+            # It already exists or lives on another filesystem, merge into it instead.
+            replace_recursively(staging_path, final_path)
+        else:
+            # mkdtemp creates the directory as 0700, give it the mode mkdir would have.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(final_path, 0o777 & ~umask)
+
+        # Collected here rather than by the fetch workers, so the order stays fixed
+        build_names = [
+            data["build_name"]
+            for data in REPOSITORIES.values()
+            if data["repo_type"] == "artifact"
+        ]
+
+        # Print the names of the downloaded packages
+        print("Downloaded the following packages:")
+        for name in build_names:
+            print(name)
+            
+        # Write build names to a text file
+        with open(final_path.joinpath('build_names.txt'), 'w') as f:
+            for name in build_names:
+                f.write(f'{name}\n')
+
+        # Record what's installed, so an unchanged install is skipped next time
+        final_path.joinpath(MANIFEST_NAME).write_bytes(
+            orjson.dumps({repo: data["version"] for repo, data in REPOSITORIES.items()})
+        )
 
 
 def main() -> None:
@@ -220,73 +468,31 @@ def main() -> None:
         console=CONSOLE,
     )
 
+    final_path = Path(sys.argv[0]).parent.joinpath("remix")
+    installed = read_manifest(final_path)
+
     with PROGRESS:
-        for repo, data in REPOSITORIES.items():
-            if data["repo_type"] == "release":
-                data["temp_dir"] = fetch_release(
-                    repo, TemporaryDirectory(prefix="RTXREMIX-")
-                )
-            elif data["repo_type"] == "artifact":
-                data["temp_dir"] = fetch_artifact(
-                    repo, TemporaryDirectory(prefix="RTXREMIX-")
+        # Look up the latest version of every repository first, they're cheap
+        # (usually a 304) and decide whether anything needs downloading at all.
+        with ThreadPoolExecutor(max_workers=len(REPOSITORIES)) as executor:
+            download_urls = dict(
+                zip(
+                    REPOSITORIES,
+                    executor.map(fetch_repository, REPOSITORIES, REPOSITORIES.values()),
                 )
+            )
 
-        main_directory = None
-        for repo, data in REPOSITORIES.items():
-            if data["main_directory"]:
-                main_directory = Path(
-                    data["temp_dir"].name
-                )  # Returns a TemporaryDirectory object
-                break
-
-        # Move all the files to their appropiate locations
-        PROGRESS.print("Moving artifacts to their appropiate locations")
-        PROGRESS.advance(STEP_COUNTER)
-        for repo, data in REPOSITORIES.items():
-            if data["main_directory"] is False:
-                if data["move_to"] is None:
-                    replace_recursively(Path(data["temp_dir"].name), main_directory)
-                else:
-                    replace_recursively(
-                        Path(data["temp_dir"].name),
-                        main_directory.joinpath(data["move_to"]),
-                    )
-
-        # Delete debugging symbols
-        # Yes this looks ugly. Too bad!
-        PROGRESS.print("Cleaning up debugging symbols")
-        PROGRESS.advance(STEP_COUNTER)
-        for child in main_directory.rglob("*.pdb"):
-            child.unlink()
-        for child in main_directory.rglob("CRC.txt"):
-            child.unlink()
-        for child in main_directory.rglob("artifacts_readme.txt"):
-            child.unlink()
-
-        # Move main_directory to working dir
-        PROGRESS.print('Moving files to the "remix" directory')
-        PROGRESS.advance(STEP_COUNTER)
-        final_path = Path(sys.argv[0]).parent.joinpath("remix")
-        final_path.mkdir(exist_ok=True)
-        replace_recursively(main_directory, final_path)
-        
-        # Print the names of the downloaded packages
-        print("Downloaded the following packages:")
-        for name in BUILD_NAMES:
-            print(name)
-            
-        # Write build names to a text file
-        with open(final_path.joinpath('build_names.txt'), 'w') as f:
-            for name in BUILD_NAMES:
-                f.write(f'{name}\n')
-
-        # Cleanup the temp dirs
-        PROGRESS.print("Cleaning up temporary directories")
-        PROGRESS.advance(STEP_COUNTER)
-        for repo, data in REPOSITORIES.items():
-            data["temp_dir"].cleanup()
-
-        PROGRESS.print("[green]Success![/green]")
+        # Later repositories overwrite files of earlier ones, so installing only the
+        # changed ones could leave older files on top. Either skip or redo everything.
+        if all(
+            data["version"] == installed.get(repo)
+            for repo, data in REPOSITORIES.items()
+        ):
+            PROGRESS.update(STEP_COUNTER, completed=STEP_TOTAL)
+            PROGRESS.print("[green]Remix is already up to date![/green]")
+        else:
+            install(download_urls, final_path)
+            PROGRESS.print("[green]Success![/green]")
 
     if Confirm.ask(
         "Would you like to open the [bold green]Remix[/bold green] directory now?",